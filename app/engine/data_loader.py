@@ -1,7 +1,71 @@
+import os
+from functools import lru_cache
+
 import pandas as pd
 
+from ..utils.pickle_cache import cached_pickle
+
+CRP_PAYMENTS_SHEET = "payment_schedules_CRP_2025"
+CRP_RULES_SHEET = "CRP_eligibility_rules"
+
+# Columns the engine actually reads from each sheet, with their dtypes.
+# Declaring them up front skips object-dtype inference and lets the reader
+# drop every other column.
+_SHEET_DTYPES = {
+    CRP_PAYMENTS_SHEET: {
+        "state": "string",
+        "county": "string",
+        "crp_practice_code": "string",
+        "base_rental_rate": "float64",
+        "contract_length_years": "Int32",
+    },
+    CRP_RULES_SHEET: {
+        "crp_practice_code": "string",
+        "field_name": "string",
+        "operator": "string",
+        "value": "string",
+    },
+}
+
+
+# Part of every sheet pickle's version key, next to the sheet's dtypes, so
+# changing _SHEET_DTYPES (or this) rebuilds the pickles.
+SHEET_CACHE_VERSION = 1
+
+
+def _cached_frame_path(path, sheet_name):
+    return f"{path}.{sheet_name}.pkl"
+
+
+@lru_cache(maxsize=None)
+def _load_sheet(path, sheet_name, mtime):
+    # `mtime` is part of the cache key, so editing the workbook
+    # on disk invalidates the cached frame.
+    dtypes = _SHEET_DTYPES.get(sheet_name)
+
+    def read():
+        return pd.read_excel(
+            path,
+            sheet_name=sheet_name,
+            engine="openpyxl",
+            engine_kwargs={"read_only": True, "data_only": True},
+            # A callable tolerates sheets that lack some of the columns; header
+            # case/whitespace is normalized later by the rule-map builder.
+            usecols=(lambda c: str(c).strip().lower() in dtypes) if dtypes else None,
+            dtype=dtypes,
+        )
+
+    return cached_pickle(
+        _cached_frame_path(path, sheet_name), mtime, (SHEET_CACHE_VERSION, dtypes), read
+    )
+
+
 def load_crp_payments(path):
-    return pd.read_excel(path, sheet_name="payment_schedules_CRP_2025")
+    return _load_sheet(path, CRP_PAYMENTS_SHEET, os.path.getmtime(path))
 
 def load_crp_rules(path):
-    return pd.read_excel(path, sheet_name="CRP_eligibility_rules")
+    return _load_sheet(path, CRP_RULES_SHEET, os.path.getmtime(path))
+
+
+def clear_crp_cache():
+    _load_sheet.cache_clear()
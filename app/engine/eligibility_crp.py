@@ -1,75 +1,158 @@
-from typing import Dict, Any, List
+from functools import lru_cache, partial
+from operator import ge, gt, le, lt
+from typing import Any, Callable, Dict, List, Optional
 
-def check_condition(parcel: Dict[str, Any], field: str, operator: str, value: str) -> bool:
+# A compiled condition: takes a parcel dict and returns pass/fail.
+Predicate = Callable[[Dict[str, Any]], bool]
+
+
+# -------------------------------------------------------
+# Predicate kernels
+#
+# Everything that depends only on the rule (operator, allowed set, numeric
+# bounds) is bound once via functools.partial; only the parcel lookup runs
+# per evaluation. Partials of module-level functions also stay picklable.
+# -------------------------------------------------------
+
+def _to_float(v: Any) -> Optional[float]:
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_in(field: str, allowed: frozenset, parcel: Dict[str, Any]) -> bool:
+    return str(parcel.get(field, None)) in allowed
+
+
+def _check_equals(field: str, value: str, parcel: Dict[str, Any]) -> bool:
+    return str(parcel.get(field, None)) == value
+
+
+def _check_not_equals(field: str, value: str, parcel: Dict[str, Any]) -> bool:
+    return str(parcel.get(field, None)) != value
+
+
+def _check_between(field: str, lo: float, hi: float, parcel: Dict[str, Any]) -> bool:
+    v_num = _to_float(parcel.get(field, None))
+    return v_num is not None and lo <= v_num <= hi
+
+
+def _check_compare(field: str, cmp: Callable[[float, float], bool], val_num: float, parcel: Dict[str, Any]) -> bool:
+    v_num = _to_float(parcel.get(field, None))
+    return v_num is not None and cmp(v_num, val_num)
+
+
+def _never(parcel: Dict[str, Any]) -> bool:
+    return False
+
+
+# Operator dispatch tables: one dict lookup instead of an if/elif chain.
+_STRING_KERNELS = {
+    "==": _check_equals,
+    "!=": _check_not_equals,
+}
+_NUMERIC_OPS = {
+    ">": gt,
+    "<": lt,
+    ">=": ge,
+    "<=": le,
+}
+
+
+def compile_condition(field: str, operator: str, value: Any) -> Predicate:
     """
-    Evaluate a single eligibility condition on a parcel dict.
+    Turn a single (field, operator, value) rule into a predicate
+    `fn(parcel) -> bool`, parsing the operator and value exactly once.
 
     Supported operators (string, case-insensitive):
       - 'in'           : comma-separated allowed values (string compare)
       - '==' / '!='    : equality / inequality (string or numeric)
       - '>' '<' '>=' '<=' : numeric comparisons when possible
       - 'between'      : numeric range, value formatted as 'min,max'
-    """
-    v = parcel.get(field, None)
 
-    # Handle 'in' as a pure string membership check
+    Malformed values and unknown operators compile to a predicate that
+    always fails (fail safe), same as evaluating them directly.
+    """
     op = operator.strip().lower()
+
+    # 'in' is a pure string membership check
     if op == "in":
-        allowed = [x.strip() for x in str(value).split(",")]
-        return str(v) in allowed
+        allowed = frozenset(x.strip() for x in str(value).split(","))
+        return partial(_check_in, field, allowed)
 
     # Direct string-based equality / inequality
-    if op == "==":
-        return str(v) == str(value)
-    if op == "!=":
-        return str(v) != str(value)
-
-    # Try numeric comparison for the remaining operators
-    try:
-        v_num = float(v)  # may raise TypeError/ValueError
-    except (TypeError, ValueError):
-        # If we cannot interpret the parcel value as a number, the condition fails
-        return False
+    string_kernel = _STRING_KERNELS.get(op)
+    if string_kernel is not None:
+        return partial(string_kernel, field, str(value))
 
     # 'between' expects 'min,max'
     if op == "between":
-        try:
-            parts = [p.strip() for p in str(value).split(",")]
-            if len(parts) != 2:
-                return False
-            lo = float(parts[0])
-            hi = float(parts[1])
-        except (TypeError, ValueError):
-            return False
-        return lo <= v_num <= hi
-
-    # All other numeric comparators expect a single numeric 'value'
+        parts = [p.strip() for p in str(value).split(",")]
+        if len(parts) != 2:
+            return _never
+        lo = _to_float(parts[0])
+        hi = _to_float(parts[1])
+        if lo is None or hi is None:
+            return _never
+        return partial(_check_between, field, lo, hi)
+
+    # All other numeric comparators expect a single numeric 'value';
+    # unknown operators fail safe.
+    cmp = _NUMERIC_OPS.get(op)
+    val_num = _to_float(value)
+    if cmp is None or val_num is None:
+        return _never
+    return partial(_check_compare, field, cmp, val_num)
+
+
+# Static evaluation cost per kernel. Conditions are ordered cheapest-first so
+# that all(...) short-circuits before reaching the numeric parses; an
+# always-failing condition goes first of all.
+_KERNEL_COST = {
+    _never: 0,
+    _check_in: 1,
+    _check_equals: 1,
+    _check_not_equals: 1,
+    _check_compare: 2,
+    _check_between: 3,
+}
+
+
+def _condition_cost(pred: Predicate) -> int:
+    return _KERNEL_COST.get(getattr(pred, "func", pred), 4)
+
+
+def check_condition(parcel: Dict[str, Any], field: str, operator: str, value: str) -> bool:
+    """
+    Evaluate a single eligibility condition on a parcel dict.
+
+    Kept for callers that evaluate ad-hoc conditions; rule maps use
+    compile_condition once per rule instead. See compile_condition for
+    the supported operators. Repeated conditions reuse one compiled
+    predicate.
+    """
     try:
-        val_num = float(value)
-    except (TypeError, ValueError):
-        return False
-
-    if op == ">":
-        return v_num > val_num
-    if op == "<":
-        return v_num < val_num
-    if op == ">=":
-        return v_num >= val_num
-    if op == "<=":
-        return v_num <= val_num
-
-    # Unknown operator -> fail safe
-    return False
+        pred = _compiled_condition(field, operator, value)
+    except TypeError:  # unhashable value: compile without the cache
+        pred = compile_condition(field, operator, value)
+    return pred(parcel)
+
 
+@lru_cache(maxsize=1024)
+def _compiled_condition(field: str, operator: str, value: Any) -> Predicate:
+    return compile_condition(field, operator, value)
 
-def build_crp_rule_map(df) -> Dict[str, List[Dict[str, Any]]]:
+
+def build_crp_rule_map(df) -> Dict[str, List[Predicate]]:
     """
-    Convert a CRP eligibility rules DataFrame into a rule_map:
+    Convert a CRP eligibility rules DataFrame into a rule_map of compiled
+    predicates (see compile_condition):
 
         {
           'CP01': [
-              {'field': 'land_cover', 'operator': 'in', 'value': 'cropland,pasture'},
-              {'field': 'slope_percent', 'operator': '<=', 'value': '8'},
+              <land_cover in {'cropland', 'pasture'}>,
+              <slope_percent <= 8.0>,
           ],
           'CP23': [ ... ],
           ...
@@ -81,6 +164,9 @@ def build_crp_rule_map(df) -> Dict[str, List[Dict[str, Any]]]:
       - 'operator'
       - 'value'
 
+    Each code's predicates are ordered cheapest-first (see _KERNEL_COST);
+    the order never changes the result, only how soon a failing rule stops.
+
     If these columns are missing, an empty map is returned.
     """
     if df is None:
@@ -95,28 +181,32 @@ def build_crp_rule_map(df) -> Dict[str, List[Dict[str, Any]]]:
         # Sheet not in the expected format; don't crash, just disable rules.
         return {}
 
-    rule_map: Dict[str, List[Dict[str, Any]]] = {}
-    for _, row in df.iterrows():
-        code = str(row.get("crp_practice_code", "")).strip()
-        field = str(row.get("field_name", "")).strip()
-        operator = str(row.get("operator", "")).strip()
-        value = str(row.get("value", "")).strip()
+    # Pull plain column arrays once instead of materializing a Series per row.
+    codes, fields, operators, values = (
+        df[col].fillna("").astype(str).to_numpy()
+        for col in ("crp_practice_code", "field_name", "operator", "value")
+    )
+
+    rule_map: Dict[str, List[Predicate]] = {}
+    for code, field, operator, value in zip(codes, fields, operators, values):
+        code = code.strip()
+        field = field.strip()
+        operator = operator.strip()
+        value = value.strip()
 
         if not code or not field or not operator:
             # skip incomplete rows
             continue
 
-        cond = {
-            "field": field,
-            "operator": operator,
-            "value": value,
-        }
-        rule_map.setdefault(code, []).append(cond)
+        rule_map.setdefault(code, []).append(compile_condition(field, operator, value))
+
+    for predicates in rule_map.values():
+        predicates.sort(key=_condition_cost)
 
     return rule_map
 
 
-def eligible_crp_practices(parcel: Dict[str, Any], rule_map: Dict[str, List[Dict[str, Any]]]) -> List[str]:
+def eligible_crp_practices(parcel: Dict[str, Any], rule_map: Dict[str, List[Predicate]]) -> List[str]:
     """
     Given a parcel dict and a rule_map (as produced by build_crp_rule_map),
     return the list of CRP practice codes for which *all* conditions pass.
@@ -128,7 +218,7 @@ def eligible_crp_practices(parcel: Dict[str, Any], rule_map: Dict[str, List[Dict
         return []
 
     eligible: List[str] = []
-    for code, conditions in rule_map.items():
-        if all(check_condition(parcel, c["field"], c["operator"], c["value"]) for c in conditions):
+    for code, predicates in rule_map.items():
+        if all(pred(parcel) for pred in predicates):
             eligible.append(code)
     return eligible
@@ -2,22 +2,32 @@
 # GIS PROCESSOR (FAKE VERSION)
 # =============================
 
+import re
+import zlib
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
+# WKT point, e.g. "POINT(-84.55 42.73)"; compiled once at import.
+_WKT_POINT_RE = re.compile(r"POINT\(\s*([^\s()]+)\s+([^\s()]+)\s*\)", re.IGNORECASE)
+
+
 def _parse_point_from_geom(parcel_geom: Any) -> Tuple[Optional[float], Optional[float]]:
-    if isinstance(parcel_geom, (list, tuple)) and len(parcel_geom) == 2:
-        try:
-            lon = float(parcel_geom[0])
-            lat = float(parcel_geom[1])
-            return lat, lon
-        except:
-            return None, None
+    # Common case first: a (lon, lat) pair.
+    if isinstance(parcel_geom, (list, tuple)):
+        if len(parcel_geom) == 2:
+            try:
+                lon = float(parcel_geom[0])
+                lat = float(parcel_geom[1])
+                return lat, lon
+            except (TypeError, ValueError):
+                return None, None
+        return None, None
 
     if isinstance(parcel_geom, dict):
         if "lat" in parcel_geom and "lon" in parcel_geom:
             try:
                 return float(parcel_geom["lat"]), float(parcel_geom["lon"])
-            except:
+            except (TypeError, ValueError):
                 return None, None
 
         if parcel_geom.get("type") == "Point":
@@ -25,17 +35,15 @@ def _parse_point_from_geom(parcel_geom: Any) -> Tuple[Optional[float], Optional[
             if len(coords) == 2:
                 try:
                     return float(coords[1]), float(coords[0])
-                except:
+                except (TypeError, ValueError):
                     return None, None
 
-    if isinstance(parcel_geom, str) and parcel_geom.upper().startswith("POINT("):
-        body = parcel_geom[6:-1].split()
-        if len(body) == 2:
+    if isinstance(parcel_geom, str):
+        m = _WKT_POINT_RE.fullmatch(parcel_geom)
+        if m:
             try:
-                lon = float(body[0])
-                lat = float(body[1])
-                return lat, lon
-            except:
+                return float(m.group(2)), float(m.group(1))
+            except ValueError:
                 return None, None
 
     return None, None
@@ -63,9 +71,10 @@ def _estimate_slope_percent(lat: Optional[float], lon: Optional[float], state: s
     return base + (abs(lon) % 3)
 
 
+@lru_cache(maxsize=8192)
 def _estimate_hydric_percent(state: str, county: str) -> float:
-    key = (state + county).lower()
-    return float((sum(ord(c) for c in key) % 60))
+    key = (state + county).lower().encode("utf-8", "ignore")
+    return float(zlib.crc32(key) % 60)
 
 
 def _classify_nwi(lat: Optional[float], hydric: float) -> str:
@@ -86,7 +95,13 @@ def _estimate_distance_to_stream_m(lat: Optional[float], lon: Optional[float]) -
 
 def process_parcel_geometry(parcel_geom: Any, state: str, county: str) -> Dict[str, Any]:
     lat, lon = _parse_point_from_geom(parcel_geom)
+    # Everything past parsing is a pure function of (lat, lon, state, county);
+    # hand back a copy so callers can't mutate the cached result.
+    return dict(_process_point(lat, lon, state, county))
+
 
+@lru_cache(maxsize=65536)
+def _process_point(lat: Optional[float], lon: Optional[float], state: str, county: str) -> Dict[str, Any]:
     land_cover = _classify_land_cover(state, county, lat)
     slope = _estimate_slope_percent(lat, lon, state)
     hydric = _estimate_hydric_percent(state, county)
@@ -1,20 +1,73 @@
-def load_crp_payments(path):
-    return pd.read_excel(path, sheet_name="payment_schedules_CRP_2025")
+import math
+import weakref
+from typing import Dict, Tuple
+
+from .data_loader import load_crp_payments  # re-exported for existing callers
+
+CrpPaymentIndex = Dict[Tuple[str, str, str], Tuple[float, int]]
+
+
+def build_crp_payment_index(df) -> CrpPaymentIndex:
+    """
+    Pre-index a CRP payment schedule as
+    {(state, county, crp_practice_code): (base_rental_rate, contract_length_years)}
+    so per-practice lookups are a dict hit instead of a DataFrame scan.
+
+    The first row wins when a key repeats; rows with a missing or non-finite
+    rate, or a missing contract length, are left out.
+    """
+    index: CrpPaymentIndex = {}
+    for state, county, code, rate, contract in zip(
+        df["state"].to_numpy(),
+        df["county"].to_numpy(),
+        df["crp_practice_code"].to_numpy(),
+        df["base_rental_rate"].to_numpy(),
+        df["contract_length_years"].to_numpy(),
+    ):
+        key = (state, county, code)
+        if key in index:
+            continue
+        try:
+            rate = float(rate)
+            contract = int(contract)
+        except (TypeError, ValueError):
+            continue
+        if not math.isfinite(rate):  # float() accepts NaN/inf
+            continue
+        index[key] = (rate, contract)
+    return index
+
+
+# id(df) -> (weak ref to df, its index). DataFrames are unhashable, so the
+# cache is keyed on identity; the entry is dropped when the frame is freed.
+_payment_indexes: Dict[int, Tuple[weakref.ref, CrpPaymentIndex]] = {}
+
+
+def crp_payment_index(df) -> CrpPaymentIndex:
+    """
+    build_crp_payment_index(df), built once per DataFrame object.
+    load_crp_payments returns the same cached frame on every call, so
+    repeated estimates against it share one index. Treat the frame as
+    read-only once it has been indexed.
+    """
+    key = id(df)
+    entry = _payment_indexes.get(key)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+
+    index = build_crp_payment_index(df)
+    _payment_indexes[key] = (weakref.ref(df), index)
+    weakref.finalize(df, _payment_indexes.pop, key, None)
+    return index
 
 
 def estimate_crp_revenue_for_practice(parcel, crp_code, lookup):
-    df = lookup
-    row = df[
-        (df["state"] == parcel["state"]) &
-        (df["county"] == parcel["county"]) &
-        (df["crp_practice_code"] == crp_code)
-    ]
-
-    if row.empty:
+    entry = crp_payment_index(lookup).get((parcel["state"], parcel["county"], crp_code))
+
+    if entry is None:
         return {"annual_payment": 0.0, "total_contract_payment": 0.0}
 
-    rate = float(row.iloc[0]["base_rental_rate"])
-    contract = int(row.iloc[0]["contract_length_years"])
+    rate, contract = entry
 
     acres = float(parcel["acres"])
 
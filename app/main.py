@@ -1,11 +1,19 @@
 import os
+import math
+import logging
 import sqlite3
 import csv
-from io import StringIO
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from io import TextIOWrapper
 from typing import List, Optional, Tuple
 
+import numpy as np
+import orjson
+import pandas as pd
 from fastapi import FastAPI, HTTPException, Query, UploadFile, File
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from .services.gis_client import fetch_terrain
@@ -19,14 +27,20 @@ from .programs.models_csp import CspQuoteResponse
 # Service layers
 from .services.eqip_quote import quote_eqip
 from .services.crp_quote import quote_crp
-from .services.crp_schedule import list_crp_counties_for_state
+from .services.crp_schedule import list_crp_counties_for_state, preload_crp_schedule
+from .services.csp_schedule import preload_csp_schedule
+from .services.eqip_schedule import preload_eqip_schedule
 from .services.csp_quote import quote_csp
+from .services.sheet_cache import shared_workbook
 
 # Engine layers
 from .engine.gis_processor import process_parcel_geometry
 from .engine.eligibility_crp import build_crp_rule_map, eligible_crp_practices
+from .engine.data_loader import clear_crp_cache, load_crp_rules
+from .utils.pickle_cache import cached_pickle
 from app.engine.gis_processor import process_parcel_geometry
 
+logger = logging.getLogger(__name__)
 
 # =======================================================
 # Paths and database setup
@@ -37,10 +51,111 @@ BASE_DIR = os.path.dirname(__file__)
 # SQLite DB lives one level up: root/parcels.db
 DB_PATH = os.path.abspath(os.path.join(BASE_DIR, "..", "parcels.db"))
 
-# Single shared connection for this process (FastAPI dev / small-scale use)
-conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+# Single shared connection for this process (FastAPI dev / small-scale use).
+# The statement cache is sized well above the number of distinct statements
+# in this module so the hot paths never re-prepare their SQL.
+conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=512)
 conn.row_factory = sqlite3.Row
 
+# WAL + synchronous=NORMAL only fsyncs at checkpoints instead of on every
+# commit, and lets reads proceed while a CSV import is writing.
+# 128 MiB page cache, 256 MiB of the file memory-mapped.
+conn.executescript(
+    """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-131072;
+    PRAGMA mmap_size=268435456;
+    PRAGMA foreign_keys=ON;
+    """
+)
+
+# Every sync endpoint runs on the threadpool against this one connection, and
+# `with conn:` commits or rolls back whatever transaction is open on it.
+# Writers hold this lock (see write_transaction) so one request can never end
+# another's transaction partway through.
+DB_WRITE_LOCK = threading.Lock()
+
+# INSERT/UPDATE ... RETURNING needs SQLite 3.35+
+SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+# =======================================================
+# SQL statements
+#
+# Kept as module constants so every call passes the identical string and
+# hits the connection's prepared-statement cache.
+# =======================================================
+
+# Column lists in the order insert values are passed
+PARCEL_CORE_COLS = (
+    "state",
+    "county",
+    "acres",
+    "purchase_price_per_acre",
+    "expected_payment_per_acre_year1",
+    "risk_score",
+    "las_score",
+    "expected_year1_payout",
+    "raw_yield_percent",
+)
+PARCEL_GIS_COLS = (
+    "lat",
+    "lon",
+    "land_cover",
+    "slope_percent",
+    "hydric_percent",
+    "nwi_class",
+    "in_100yr_floodplain",
+    "distance_to_stream_m",
+)
+PARCEL_FULL_COLS = PARCEL_CORE_COLS + PARCEL_GIS_COLS
+
+
+def _insert_parcels_sql(cols: Tuple[str, ...]) -> str:
+    placeholders = ", ".join("?" * len(cols))
+    return f"INSERT INTO parcels ({', '.join(cols)}) VALUES ({placeholders})"
+
+
+SQL_INSERT_PARCEL_FULL = _insert_parcels_sql(PARCEL_FULL_COLS)
+
+SQL_INSERT_PARCEL_CORE = _insert_parcels_sql(PARCEL_CORE_COLS)
+
+SQL_UPDATE_PARCEL = """
+UPDATE parcels
+SET state = ?, county = ?, acres = ?, purchase_price_per_acre = ?,
+    expected_payment_per_acre_year1 = ?, risk_score = ?,
+    las_score = ?, expected_year1_payout = ?, raw_yield_percent = ?
+WHERE id = ?
+"""
+
+SQL_SELECT_BY_ID = "SELECT * FROM parcels WHERE id = ?"
+
+# RETURNING * forms of the single-row writes (see execute_returning_row)
+SQL_RETURNING = {
+    sql: sql.rstrip() + " RETURNING *"
+    for sql in (SQL_INSERT_PARCEL_FULL, SQL_INSERT_PARCEL_CORE, SQL_UPDATE_PARCEL)
+}
+
+_SQL_COUNTY_STATS_TEMPLATE = """
+SELECT
+    state,
+    county,
+    COUNT(*) AS parcel_count,
+    ROUND(COALESCE(AVG(las_score), 0), 2) AS avg_las_score,
+    ROUND(COALESCE(AVG(raw_yield_percent), 0), 2) AS avg_raw_yield_percent,
+    ROUND(COALESCE(SUM(expected_year1_payout), 0), 2) AS total_expected_year1_payout
+FROM parcels
+{where_clause}
+GROUP BY state, county
+ORDER BY AVG(las_score) DESC
+"""
+
+SQL_COUNTY_STATS = _SQL_COUNTY_STATS_TEMPLATE.format(where_clause="")
+
+SQL_COUNTY_STATS_FOR_STATE = _SQL_COUNTY_STATS_TEMPLATE.format(where_clause="WHERE state = ?")
+
 
 def init_db() -> None:
     """
@@ -72,6 +187,21 @@ def init_db() -> None:
 
             """
         )
+        # county_stats groups by (state, county) and only aggregates these
+        # three columns, so this index covers it (no table lookups).
+        # It supersedes the plain (state, county) index.
+        conn.execute("DROP INDEX IF EXISTS ix_parcels_state_county")
+        conn.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ix_parcels_county_stats ON parcels(
+                state, county, las_score, raw_yield_percent, expected_year1_payout
+            )
+            """
+        )
+        # /parcels/top orders by las_score
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_parcels_las_desc ON parcels(las_score DESC)"
+        )
 
 
 # =======================================================
@@ -194,34 +324,152 @@ def compute_metrics(
     )
 
 
-def row_to_parcel(row: sqlite3.Row) -> ParcelOut:
+def compute_metrics_batch(
+    acres: np.ndarray,
+    price_acre: np.ndarray,
+    pay_acre: np.ndarray,
+    risk: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized compute_metrics over equal-length float arrays.
+    Returns (las_score, expected_payout, raw_yield_percent) arrays.
     """
-    Convert a parcels row into a ParcelOut model.
-    """
-    return ParcelOut(
-        id=row["id"],
-        state=row["state"],
-        county=row["county"],
-        acres=row["acres"],
-        purchase_price_per_acre=row["purchase_price_per_acre"],
-        expected_payment_per_acre_year1=row["expected_payment_per_acre_year1"],
-        risk_score=row["risk_score"],
-        las_score=row["las_score"],
-        expected_year1_payout=row["expected_year1_payout"],
-        raw_yield_percent=row["raw_yield_percent"],
-        lat=row["lat"],
-        lon=row["lon"],
-        land_cover=row["land_cover"],
-        slope_percent=row["slope_percent"],
-        hydric_percent=row["hydric_percent"],
-        nwi_class=row["nwi_class"],
-        in_100yr_floodplain=(
-            bool(row["in_100yr_floodplain"]) if row["in_100yr_floodplain"] is not None else None
-        ),
-        distance_to_stream_m=row["distance_to_stream_m"],
+    acres = np.asarray(acres, dtype="float64")
+    price_acre = np.asarray(price_acre, dtype="float64")
+    pay_acre = np.asarray(pay_acre, dtype="float64")
+    risk = np.asarray(risk, dtype="float64")
+
+    expected_payout = acres * pay_acre
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw_yield_percent = np.where(price_acre != 0, pay_acre / price_acre * 100, 0.0)
+    las_score = raw_yield_percent * (1 - risk) * 20.0
+    return (
+        _round_2(las_score),
+        _round_2(expected_payout),
+        _round_2(raw_yield_percent),
     )
 
 
+def _round_2(values: np.ndarray) -> np.ndarray:
+    """
+    round(x, 2) per element, so batch scores match compute_metrics exactly.
+    Scaled rounding (rint(x * 100) / 100, or np.round) differs from Python's
+    correctly rounded round() on some values, e.g. 127.535.
+    """
+    return np.fromiter((round(v, 2) for v in values.tolist()), dtype="float64", count=len(values))
+
+
+# Response key order for parcels, matching the ParcelOut schema
+PARCEL_OUT_FIELDS = tuple(ParcelOut.model_fields)
+
+
+def row_to_dict(row: sqlite3.Row) -> dict:
+    """
+    Convert a parcels row into a plain ParcelOut-shaped dict.
+
+    DB rows were validated on the way in, so read endpoints serialize these
+    directly instead of re-validating every field through Pydantic.
+    """
+    d = dict(zip(row.keys(), row))
+    flood = d["in_100yr_floodplain"]
+    d["in_100yr_floodplain"] = bool(flood) if flood is not None else None
+    return {k: d.get(k) for k in PARCEL_OUT_FIELDS}
+
+
+def row_to_parcel(row: sqlite3.Row) -> ParcelOut:
+    """
+    Convert a parcels row into a ParcelOut model (without re-validation).
+    """
+    return ParcelOut.model_construct(**row_to_dict(row))
+
+
+
+def insert_parcel_rows(values: List[tuple]) -> List[sqlite3.Row]:
+    """
+    Insert many core parcel rows
+      (state, county, acres, purchase_price_per_acre,
+       expected_payment_per_acre_year1, risk_score,
+       las_score, expected_year1_payout, raw_yield_percent)
+    and return the written rows, in input order.
+
+    Each row comes back from its own INSERT ... RETURNING (see
+    execute_returning_row), so the result never depends on the new ids
+    being contiguous. Call inside write_transaction().
+    """
+    return [execute_returning_row(SQL_INSERT_PARCEL_CORE, v) for v in values]
+
+
+def execute_returning_row(sql: str, params: tuple, row_id: Optional[int] = None) -> sqlite3.Row:
+    """
+    Run a single-row INSERT or UPDATE on parcels and return the written row.
+
+    Uses RETURNING * when SQLite supports it, otherwise falls back to a
+    SELECT by id (`row_id`, or the new rowid for an INSERT).
+    Call inside write_transaction().
+    """
+    if SQLITE_HAS_RETURNING:
+        returning_sql = SQL_RETURNING.get(sql) or sql + " RETURNING *"
+        return conn.execute(returning_sql, params).fetchone()
+
+    cur = conn.execute(sql, params)
+    if row_id is None:
+        row_id = cur.lastrowid
+    return conn.execute(SQL_SELECT_BY_ID, (row_id,)).fetchone()
+
+
+@contextmanager
+def write_transaction():
+    """
+    `with conn:` while holding DB_WRITE_LOCK. Use it for every write on the
+    shared connection.
+    """
+    with DB_WRITE_LOCK, conn:
+        yield
+
+
+@contextmanager
+def bulk_write_transaction():
+    """
+    Write transaction for bulk imports, used like write_transaction().
+
+    BEGIN IMMEDIATE takes the write lock up front instead of upgrading from a
+    read lock mid-import, and synchronous=OFF skips the fsyncs for the
+    duration (the batch commits or rolls back as one unit anyway). The
+    connection goes back to synchronous=NORMAL afterwards.
+
+    synchronous is a per-connection setting, so it is only changed while
+    DB_WRITE_LOCK is held: no other request can commit on the shared
+    connection while durability is relaxed.
+    """
+    with DB_WRITE_LOCK:
+        conn.execute("PRAGMA synchronous=OFF")
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                yield
+        finally:
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+
+def check_finite_inputs(*values: float) -> None:
+    """
+    Raise ValueError unless every LAS input is a finite number. float()
+    accepts 'nan' and 'inf' text, which would otherwise reach the NOT NULL
+    score columns as NaN.
+    """
+    if not all(map(math.isfinite, values)):
+        raise ValueError("non-finite numeric value")
+
+
+def float_or_nan(text) -> float:
+    """
+    float(text), or NaN where float() refuses the cell.
+    """
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return math.nan
+
 
 # Common CSV columns for LAS scoring
 LAS_REQUIRED_COLUMNS = {
@@ -233,17 +481,52 @@ LAS_REQUIRED_COLUMNS = {
     "risk_score",
 }
 
+# Numeric inputs to compute_metrics, in argument order
+LAS_NUMERIC_COLUMNS = (
+    "acres",
+    "purchase_price_per_acre",
+    "expected_payment_per_acre_year1",
+    "risk_score",
+)
+
+
+def upload_text_stream(file: UploadFile) -> TextIOWrapper:
+    """
+    Decode an uploaded CSV lazily straight from its spooled temp file,
+    instead of reading the whole body into bytes and then into a str.
+    """
+    return TextIOWrapper(file.file, encoding="utf-8", errors="ignore", newline="")
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson. It is the app's default_response_class,
+    so every route, including new ones, renders with orjson. Endpoints that
+    return plain dicts/lists (DB rows, dumped models) also construct it
+    directly, which skips FastAPI's jsonable_encoder pass.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
 
 # =======================================================
 # FastAPI app
 # =======================================================
 
-app = FastAPI(title="LAS Parcel API", version="1.4")
+app = FastAPI(title="LAS Parcel API", version="1.4", default_response_class=ORJSONResponse)
 
 
 @app.on_event("startup")
 def on_startup() -> None:
     init_db()
+    app.state.crp_rule_map = load_crp_rule_map()
+    # Pay the schedule load/index cost here instead of on the first quote,
+    # parsing any stale sheets from one workbook that is closed afterwards
+    with shared_workbook(CRP_MASTER_XLSX):
+        preload_crp_schedule()
+        preload_eqip_schedule()
+        preload_csp_schedule()
 
 
 @app.get("/")
@@ -299,28 +582,9 @@ def create_single(parcel: ParcelCreate):
     dist_stream = gis.get("distance_to_stream_m")
 
     # 3) Insert into DB (now including GIS columns)
-    with conn:
-        cur = conn.execute(
-            """
-            INSERT INTO parcels (
-                state, county, acres,
-                purchase_price_per_acre,
-                expected_payment_per_acre_year1,
-                risk_score,
-                las_score,
-                expected_year1_payout,
-                raw_yield_percent,
-                lat,
-                lon,
-                land_cover,
-                slope_percent,
-                hydric_percent,
-                nwi_class,
-                in_100yr_floodplain,
-                distance_to_stream_m
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+    with write_transaction():
+        row = execute_returning_row(
+            SQL_INSERT_PARCEL_FULL,
             (
                 parcel.state,
                 parcel.county,
@@ -341,9 +605,7 @@ def create_single(parcel: ParcelCreate):
                 dist_stream,
             ),
         )
-        new_id = cur.lastrowid
 
-    row = conn.execute("SELECT * FROM parcels WHERE id = ?", (new_id,)).fetchone()
     parcel_out = row_to_parcel(row)
 
     # 4) Remote GIS (DigitalOcean) – attach elevation & slope to response only
@@ -362,51 +624,29 @@ def create_single(parcel: ParcelCreate):
 
 @app.post("/parcels", response_model=List[ParcelOut])
 def create_bulk(parcels: List[ParcelCreate]):
-    created: List[ParcelOut] = []
-
-    with conn:
-        for p in parcels:
-            las, payout, raw = compute_metrics(
+    # Score everything up front so the write transaction only does the insert
+    values = [
+        (
+            p.state,
+            p.county,
+            p.acres,
+            p.purchase_price_per_acre,
+            p.expected_payment_per_acre_year1,
+            p.risk_score,
+            *compute_metrics(
                 p.acres,
                 p.purchase_price_per_acre,
                 p.expected_payment_per_acre_year1,
                 p.risk_score,
-            )
-
-            cur = conn.execute(
-                """
-                INSERT INTO parcels (
-                    state, county, acres,
-                    purchase_price_per_acre,
-                    expected_payment_per_acre_year1,
-                    risk_score,
-                    las_score,
-                    expected_year1_payout,
-                    raw_yield_percent
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    p.state,
-                    p.county,
-                    p.acres,
-                    p.purchase_price_per_acre,
-                    p.expected_payment_per_acre_year1,
-                    p.risk_score,
-                    las,
-                    payout,
-                    raw,
-                ),
-            )
-
-            db_row = conn.execute(
-                "SELECT * FROM parcels WHERE id = ?",
-                (cur.lastrowid,),
-            ).fetchone()
+            ),
+        )
+        for p in parcels
+    ]
 
-            created.append(row_to_parcel(db_row))
+    with write_transaction():
+        db_rows = insert_parcel_rows(values)
 
-    return created
+    return [row_to_parcel(r) for r in db_rows]
 
 
 # =======================================================
@@ -414,71 +654,65 @@ def create_bulk(parcels: List[ParcelCreate]):
 # =======================================================
 
 @app.post("/parcels/import_csv", response_model=List[ParcelOut])
-async def import_parcels_csv(file: UploadFile = File(...)):
+def import_parcels_csv(file: UploadFile = File(...)):
     """
     Import parcels from a CSV with headers:
     state, county, acres, purchase_price_per_acre,
     expected_payment_per_acre_year1, risk_score
+
+    Rows with a missing, non-numeric or non-finite (nan/inf) numeric value
+    are skipped.
     """
     if not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="File must be a .csv")
 
-    content = (await file.read()).decode("utf-8", errors="ignore")
-    reader = csv.DictReader(StringIO(content))
+    # Positional csv.reader: no per-row dict like DictReader builds
+    reader = csv.reader(upload_text_stream(file))
+    header = next(reader, [])
 
-    if not LAS_REQUIRED_COLUMNS.issubset(reader.fieldnames or []):
+    if not LAS_REQUIRED_COLUMNS.issubset(header):
         raise HTTPException(
             status_code=400,
             detail=f"CSV must contain: {', '.join(sorted(LAS_REQUIRED_COLUMNS))}",
         )
 
-    created: List[ParcelOut] = []
+    i_state = header.index("state")
+    i_county = header.index("county")
+    i_numeric = tuple(header.index(c) for c in LAS_NUMERIC_COLUMNS)
 
-    with conn:
-        for row in reader:
-            try:
-                state = row["state"]
-                county = row["county"]
-                acres = float(row["acres"])
-                price_acre = float(row["purchase_price_per_acre"])
-                pay_acre = float(row["expected_payment_per_acre_year1"])
-                risk = float(row["risk_score"])
-
-                las, payout, raw = compute_metrics(acres, price_acre, pay_acre, risk)
-
-                cur = conn.execute(
-                    """
-                    INSERT INTO parcels (
-                        state, county, acres,
-                        purchase_price_per_acre,
-                        expected_payment_per_acre_year1,
-                        risk_score,
-                        las_score,
-                        expected_year1_payout,
-                        raw_yield_percent
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (state, county, acres, price_acre, pay_acre, risk, las, payout, raw),
-                )
-
-                new_id = cur.lastrowid
-                db_row = conn.execute(
-                    "SELECT * FROM parcels WHERE id = ?",
-                    (new_id,),
-                ).fetchone()
-
-                created.append(row_to_parcel(db_row))
-
-            except Exception as e:
-                # Log but keep importing remaining rows
-                print(f"Skipping row in import_csv: {e} — {row!r}")
-                continue
-
-    if not created:
+    values = []
+    skipped = 0
+
+    # Parse and score the whole upload before writing, so the write
+    # transaction never waits on the client's upload.
+    for row in reader:
+        if not row:
+            continue
+        try:
+            state = row[i_state]
+            county = row[i_county]
+            acres, price_acre, pay_acre, risk = (float(row[i]) for i in i_numeric)
+            check_finite_inputs(acres, price_acre, pay_acre, risk)
+
+            las, payout, raw = compute_metrics(acres, price_acre, pay_acre, risk)
+            values.append((state, county, acres, price_acre, pay_acre, risk, las, payout, raw))
+
+        except Exception as e:
+            # Log but keep importing remaining rows
+            logger.debug("Skipping row in import_csv: %s — %r", e, row)
+            skipped += 1
+            continue
+
+    with bulk_write_transaction():
+        db_rows = insert_parcel_rows(values)
+
+    if skipped:
+        logger.warning("import_csv skipped %d invalid row(s)", skipped)
+
+    if not db_rows:
         raise HTTPException(status_code=400, detail="No valid rows imported")
 
-    return created
+    return [row_to_parcel(r) for r in db_rows]
 
 
 # =======================================================
@@ -486,58 +720,68 @@ async def import_parcels_csv(file: UploadFile = File(...)):
 # =======================================================
 
 @app.post("/parcels/rank_csv")
-async def rank_parcels_csv(file: UploadFile = File(...)):
+def rank_parcels_csv(file: UploadFile = File(...)):
     """
     Accept a CSV, compute LAS metrics for each row,
     and return a ranked CSV (no DB insert).
+
+    Skipped rows (left out of the ranked CSV):
+      - lines with more fields than the header (malformed CSV lines)
+      - rows whose numeric columns are missing, non-numeric or non-finite
+        (nan/inf), the same rows import_csv rejects
     """
     if not file.filename.lower().endswith(".csv"):
         raise HTTPException(status_code=400, detail="File must be a .csv")
 
-    content = (await file.read()).decode("utf-8", errors="ignore")
-    reader = csv.DictReader(StringIO(content))
+    try:
+        # Keep every cell as text so the ranked CSV echoes the input verbatim
+        df = pd.read_csv(
+            upload_text_stream(file),
+            dtype=str,
+            keep_default_na=False,
+            index_col=False,
+            on_bad_lines="skip",
+        )
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame()
 
-    if not LAS_REQUIRED_COLUMNS.issubset(reader.fieldnames or []):
+    if not LAS_REQUIRED_COLUMNS.issubset(df.columns):
         raise HTTPException(
             status_code=400,
             detail=f"CSV must contain: {', '.join(sorted(LAS_REQUIRED_COLUMNS))}",
         )
 
-    rows_with_scores = []
-
-    for row in reader:
-        try:
-            acres = float(row["acres"])
-            price_acre = float(row["purchase_price_per_acre"])
-            pay_acre = float(row["expected_payment_per_acre_year1"])
-            risk = float(row["risk_score"])
-
-            las, payout, raw = compute_metrics(acres, price_acre, pay_acre, risk)
+    # float() per cell, like import_csv, so both endpoints accept the same text
+    acres, price_acre, pay_acre, risk = (
+        np.fromiter(map(float_or_nan, df[col].tolist()), dtype="float64", count=len(df))
+        for col in LAS_NUMERIC_COLUMNS
+    )
+    valid = np.isfinite(acres) & np.isfinite(price_acre) & np.isfinite(pay_acre) & np.isfinite(risk)
 
-            enriched = dict(row)
-            enriched["las_score"] = las
-            enriched["expected_year1_payout"] = payout
-            enriched["raw_yield_percent"] = raw
-            rows_with_scores.append(enriched)
-        except Exception as e:
-            print(f"Skipping row in rank_csv: {e} — {row!r}")
-            continue
+    skipped = int((~valid).sum())
+    if skipped:
+        logger.warning("rank_csv skipped %d row(s) with an invalid numeric value", skipped)
 
-    if not rows_with_scores:
+    if not valid.any():
         raise HTTPException(status_code=400, detail="No valid rows in CSV")
 
-    # Rank by LAS score
-    rows_with_scores.sort(key=lambda r: r["las_score"], reverse=True)
-    for i, r in enumerate(rows_with_scores, start=1):
-        r["rank"] = i
+    if not valid.all():
+        df = df.loc[valid]
+        acres, price_acre, pay_acre, risk = acres[valid], price_acre[valid], pay_acre[valid], risk[valid]
+
+    las, payout, raw = compute_metrics_batch(acres, price_acre, pay_acre, risk)
 
-    fieldnames = list(rows_with_scores[0].keys())
-    output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(rows_with_scores)
+    # Rank by LAS score (stable, so ties keep their input order); ordering
+    # the arrays directly avoids a second pandas sort over the text columns.
+    order = np.argsort(-las, kind="stable")
+    df = df.iloc[order].assign(
+        las_score=las[order],
+        expected_year1_payout=payout[order],
+        raw_yield_percent=raw[order],
+        rank=np.arange(1, len(order) + 1),
+    )
 
-    csv_text = output.getvalue()
+    csv_text = df.to_csv(index=False, lineterminator="\r\n")
     return Response(
         content=csv_text,
         media_type="text/csv",
@@ -549,91 +793,75 @@ async def rank_parcels_csv(file: UploadFile = File(...)):
 # GET /parcels
 # =======================================================
 
-@app.get("/parcels", response_model=List[ParcelOut])
+# Rows serialized per streamed chunk of the /parcels JSON array
+LIST_STREAM_BATCH = 500
+
+
+def _stream_parcels_json(cur: sqlite3.Cursor):
+    """
+    Yield a JSON array of parcels from an open cursor, one chunk of
+    LIST_STREAM_BATCH rows at a time, so only one chunk is in memory.
+    """
+    yield b"["
+    sep = b""
+    while True:
+        rows = cur.fetchmany(LIST_STREAM_BATCH)
+        if not rows:
+            break
+        yield sep + b",".join(orjson.dumps(row_to_dict(r)) for r in rows)
+        sep = b","
+    yield b"]"
+
+
+@app.get("/parcels", responses={200: {"model": List[ParcelOut]}})
 def list_parcels():
-    rows = conn.execute("SELECT * FROM parcels ORDER BY id ASC").fetchall()
-    return [row_to_parcel(r) for r in rows]
+    cur = conn.execute("SELECT * FROM parcels ORDER BY id ASC")
+    return StreamingResponse(_stream_parcels_json(cur), media_type="application/json")
 
 
 # =======================================================
 # GET /parcels/top
 # =======================================================
 
-@app.get("/parcels/top", response_model=List[ParcelOut])
+@app.get("/parcels/top", responses={200: {"model": List[ParcelOut]}})
 def top_parcels(limit: int = Query(10, gt=0, le=100)):
     rows = conn.execute(
         "SELECT * FROM parcels ORDER BY las_score DESC LIMIT ?",
         (limit,),
     ).fetchall()
-    return [row_to_parcel(r) for r in rows]
+    return ORJSONResponse([row_to_dict(r) for r in rows])
 
 
 # =======================================================
-# GET /parcels/{id}
+# COUNTY STATS
+#
+# Registered before /parcels/{parcel_id} so the path isn't captured as an id.
 # =======================================================
 
-@app.get("/parcels/{parcel_id}", response_model=ParcelOut)
-def get_parcel(parcel_id: int):
-    row = conn.execute(
-        "SELECT * FROM parcels WHERE id = ?",
-        (parcel_id,),
-    ).fetchone()
-
-    if row is None:
-        raise HTTPException(status_code=404, detail="Parcel not found")
+@app.get("/parcels/county_stats", responses={200: {"model": List[CountyStats]}})
+def county_stats(state: Optional[str] = Query(None, description="Filter by state")):
+    # Rounding happens in SQL, so rows go straight out as dicts;
+    # groups are still ordered by the unrounded average.
+    if state:
+        rows = conn.execute(SQL_COUNTY_STATS_FOR_STATE, (state,)).fetchall()
+    else:
+        rows = conn.execute(SQL_COUNTY_STATS).fetchall()
 
-    return row_to_parcel(row)
+    return ORJSONResponse([dict(row) for row in rows])
 
 
 # =======================================================
-# COUNTY STATS
+# GET /parcels/{id}
 # =======================================================
 
-@app.get("/parcels/county_stats", response_model=List[CountyStats])
-def county_stats(state: Optional[str] = Query(None, description="Filter by state")):
-    params: List[str] = []
-    where_clause = ""
+@app.get("/parcels/{parcel_id}", responses={200: {"model": ParcelOut}})
+def get_parcel(parcel_id: int):
+    row = conn.execute(SQL_SELECT_BY_ID, (parcel_id,)).fetchone()
 
-    if state:
-        where_clause = "WHERE state = ?"
-        params.append(state)
-
-    sql = f"""
-        SELECT
-            state,
-            county,
-            COUNT(*) AS parcel_count,
-            AVG(las_score) AS avg_las_score,
-            AVG(raw_yield_percent) AS avg_raw_yield_percent,
-            SUM(expected_year1_payout) AS total_expected_year1_payout
-        FROM parcels
-        {where_clause}
-        GROUP BY state, county
-        ORDER BY avg_las_score DESC
-    """
-
-    rows = conn.execute(sql, params).fetchall()
-
-    stats: List[CountyStats] = []
-    for row in rows:
-        stats.append(
-            CountyStats(
-                state=row["state"],
-                county=row["county"],
-                parcel_count=row["parcel_count"],
-                avg_las_score=round(row["avg_las_score"], 2)
-                if row["avg_las_score"] is not None
-                else 0.0,
-                avg_raw_yield_percent=round(row["avg_raw_yield_percent"], 2)
-                if row["avg_raw_yield_percent"] is not None
-                else 0.0,
-                total_expected_year1_payout=round(row["total_expected_year1_payout"], 2)
-                if row["total_expected_year1_payout"] is not None
-                else 0.0,
-            )
-        )
+    if row is None:
+        raise HTTPException(status_code=404, detail="Parcel not found")
 
-    return stats
+    return ORJSONResponse(row_to_dict(row))
 
 
 # =======================================================
@@ -642,7 +870,7 @@ def county_stats(state: Optional[str] = Query(None, description="Filter by state
 
 @app.put("/parcels/{parcel_id}", response_model=ParcelOut)
 def update_parcel(parcel_id: int, updates: ParcelUpdate):
-    row = conn.execute("SELECT * FROM parcels WHERE id = ?", (parcel_id,)).fetchone()
+    row = conn.execute(SQL_SELECT_BY_ID, (parcel_id,)).fetchone()
     if row is None:
         raise HTTPException(status_code=404, detail="Parcel not found")
 
@@ -667,23 +895,13 @@ def update_parcel(parcel_id: int, updates: ParcelUpdate):
 
     las, payout, raw = compute_metrics(acres, price_acre, pay_acre, risk)
 
-    with conn:
-        conn.execute(
-            """
-            UPDATE parcels
-            SET state = ?, county = ?, acres = ?, purchase_price_per_acre = ?,
-                expected_payment_per_acre_year1 = ?, risk_score = ?,
-                las_score = ?, expected_year1_payout = ?, raw_yield_percent = ?
-            WHERE id = ?
-            """,
+    with write_transaction():
+        updated = execute_returning_row(
+            SQL_UPDATE_PARCEL,
             (state, county, acres, price_acre, pay_acre, risk, las, payout, raw, parcel_id),
+            row_id=parcel_id,
         )
 
-    updated = conn.execute(
-        "SELECT * FROM parcels WHERE id = ?",
-        (parcel_id,),
-    ).fetchone()
-
     return row_to_parcel(updated)
 
 
@@ -693,7 +911,7 @@ def update_parcel(parcel_id: int, updates: ParcelUpdate):
 
 @app.delete("/parcels/{parcel_id}")
 def delete_parcel(parcel_id: int):
-    with conn:
+    with write_transaction():
         cur = conn.execute("DELETE FROM parcels WHERE id = ?", (parcel_id,))
         if cur.rowcount == 0:
             raise HTTPException(status_code=404, detail="Parcel not found")
@@ -707,7 +925,7 @@ def delete_parcel(parcel_id: int):
 
 @app.delete("/parcels/reset")
 def reset_parcels():
-    with conn:
+    with write_transaction():
         cur = conn.execute("DELETE FROM parcels")
         deleted = cur.rowcount
     return {"deleted_rows": deleted}
@@ -717,7 +935,7 @@ def reset_parcels():
 # GIS
 # =======================================================
 
-@app.get("/programs/quote_all_gis", response_model=ProgramsQuoteAllGISResponse)
+@app.get("/programs/quote_all_gis", responses={200: {"model": ProgramsQuoteAllGISResponse}})
 def programs_quote_all_gis(
     state: str = Query(..., description="State abbrev or name, e.g. MI or Michigan"),
     county: str = Query(..., description="County name (case-insensitive, 'County' suffix optional)"),
@@ -747,36 +965,49 @@ def programs_quote_all_gis(
     eqip_filtered = filter_eqip_by_gis(eqip_raw, gis)
     csp_filtered = filter_csp_by_gis(csp_raw, gis)
 
-    return ProgramsQuoteAllGISResponse(
-        state=state,
-        county=county,
-        acres=acres,
-        gis=gis,
-        crp=crp_filtered,
-        eqip=eqip_filtered,
-        csp=csp_filtered,
-    )
+    # Every part is already a validated model: dump each once instead of
+    # re-validating the whole composite as a response_model.
+    return ORJSONResponse({
+        "state": state,
+        "county": county,
+        "acres": acres,
+        "gis": gis.model_dump(),
+        "crp": crp_filtered.model_dump(),
+        "eqip": eqip_filtered.model_dump(),
+        "csp": csp_filtered.model_dump(),
+    })
 
 # =======================================================
 # GIS-based filtering for program practices
 # =======================================================
 
-def _is_wetland_like_name(name: str) -> bool:
-    n = name.lower()
-    wet_keywords = ["wetland", "marsh", "bog", "floodplain", "riparian", "stream buffer"]
-    return any(k in n for k in wet_keywords)
+# Keyword tuples are built once at import. The helpers below take a name
+# that the caller has already lowercased (once per practice).
+WET_KEYWORDS = ("wetland", "marsh", "bog", "floodplain", "riparian", "stream buffer")
+EROSION_KEYWORDS = ("erosion", "gully", "terrace", "waterway", "grade stabilization", "diversion")
+PASTURE_KEYWORDS = ("pasture", "grazing", "rangeland", "forage")
+
+
+def _is_wetland_like_name(n: str) -> bool:
+    return any(k in n for k in WET_KEYWORDS)
 
 
-def _is_erosion_like_name(name: str) -> bool:
-    n = name.lower()
-    eros_keywords = ["erosion", "gully", "terrace", "waterway", "grade stabilization", "diversion"]
-    return any(k in n for k in eros_keywords)
+def _is_erosion_like_name(n: str) -> bool:
+    return any(k in n for k in EROSION_KEYWORDS)
 
 
-def _is_pasture_like_name(name: str) -> bool:
-    n = name.lower()
-    pasture_keywords = ["pasture", "grazing", "rangeland", "forage"]
-    return any(k in n for k in pasture_keywords)
+def _is_pasture_like_name(n: str) -> bool:
+    return any(k in n for k in PASTURE_KEYWORDS)
+
+
+@lru_cache(maxsize=4096)
+def _practice_name_flags(name: Optional[str]) -> Tuple[bool, bool]:
+    """
+    (wetland_like, erosion_like) for a practice name. Practice names come from
+    the fixed schedules, so each one is classified once per process.
+    """
+    n = (name or "").lower()
+    return _is_wetland_like_name(n), _is_erosion_like_name(n)
 
 
 def filter_crp_by_gis(crp: CrpQuoteResponse, gis: GISAttributes) -> CrpQuoteResponse:
@@ -814,8 +1045,9 @@ def filter_crp_by_gis(crp: CrpQuoteResponse, gis: GISAttributes) -> CrpQuoteResp
         "distance_to_stream_m": gis.distance_to_stream_m,
     }
 
+    # Built once per request for O(1) membership; empty means no restriction.
     rule_map = get_crp_rule_map()
-    eligible_codes = eligible_crp_practices(parcel, rule_map) if rule_map else None
+    eligible_codes = frozenset(eligible_crp_practices(parcel, rule_map)) if rule_map else frozenset()
 
     # Simple dryness check for additional filtering
     dry_upland = (gis.nwi_class == "NONE") and (gis.hydric_percent < 20.0)
@@ -823,14 +1055,11 @@ def filter_crp_by_gis(crp: CrpQuoteResponse, gis: GISAttributes) -> CrpQuoteResp
     filtered = []
     for p in crp.practices:
         # 1) If rules are defined, skip practices that are not eligible.
-        if eligible_codes is not None and len(eligible_codes) > 0:
-            if p.crp_practice_code not in eligible_codes:
-                continue
-
-        name = p.crp_practice_name or ""
+        if eligible_codes and p.crp_practice_code not in eligible_codes:
+            continue
 
         # 2) Drop obviously wetland-focused practices on very dry upland sites.
-        if dry_upland and _is_wetland_like_name(name):
+        if dry_upland and _practice_name_flags(p.crp_practice_name)[0]:
             continue
 
         filtered.append(p)
@@ -859,13 +1088,13 @@ def filter_eqip_by_gis(eqip: EqipQuoteResponse, gis: GISAttributes) -> EqipQuote
 
     filtered = []
     for p in eqip.practices:
-        name = p.scenario_name or ""
+        wet_like, erosion_like = _practice_name_flags(p.scenario_name)
 
-        if _is_wetland_like_name(name) and not has_wet_signal:
+        if not has_wet_signal and wet_like:
             # Drop wetland practices on obviously dry sites
             continue
 
-        if _is_erosion_like_name(name) and low_slope:
+        if low_slope and erosion_like:
             # Drop erosion-control practices on basically flat land
             continue
 
@@ -893,12 +1122,12 @@ def filter_csp_by_gis(csp: CspQuoteResponse, gis: GISAttributes) -> CspQuoteResp
 
     filtered = []
     for p in csp.practices:
-        name = p.scenario_name or ""
+        wet_like, erosion_like = _practice_name_flags(p.scenario_name)
 
-        if _is_wetland_like_name(name) and not has_wet_signal:
+        if not has_wet_signal and wet_like:
             continue
 
-        if _is_erosion_like_name(name) and low_slope:
+        if low_slope and erosion_like:
             continue
 
         filtered.append(p)
@@ -917,29 +1146,64 @@ def filter_csp_by_gis(csp: CspQuoteResponse, gis: GISAttributes) -> CspQuoteResp
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, "data")
 CRP_MASTER_XLSX = os.path.join(DATA_DIR, "USDA_CONSERVATION_MASTER.xlsx")
-CRP_RULES_SHEET = "CRP_eligibility_rules"
 
-_crp_rule_map = None
 
-def get_crp_rule_map():
+# Compiled rule map persisted next to the workbook, so a cold start can skip
+# pandas/openpyxl entirely while the workbook is unchanged.
+CRP_RULES_PICKLE = os.path.join(DATA_DIR, "crp_rules.pkl")
+
+# Stored with the pickled rule map. The map holds partials of the
+# eligibility_crp kernels, so bump this whenever a kernel, its bound
+# arguments or _KERNEL_COST changes; a mismatched pickle is rebuilt.
+RULES_CACHE_VERSION = 1
+
+
+def load_crp_rule_map(refresh: bool = False):
     """
-    Lazy-load and cache the CRP eligibility rule map from the Excel workbook.
+    Load the CRP eligibility rules sheet and compile it into a rule map.
+
+    Uses CRP_RULES_PICKLE when it is newer than the workbook and was written
+    with the current RULES_CACHE_VERSION (unless `refresh`), otherwise
+    rebuilds from the sheet and rewrites the pickle (see cached_pickle).
 
     If the sheet is missing or not in the expected format, an empty map is returned,
     and CRP eligibility rules are effectively disabled (no additional filtering).
     """
-    global _crp_rule_map
-    if _crp_rule_map is not None:
-        return _crp_rule_map
+    try:
+        xlsx_mtime = os.path.getmtime(CRP_MASTER_XLSX)
+    except OSError:
+        return {}
+
+    def compile_rules():
+        return build_crp_rule_map(load_crp_rules(CRP_MASTER_XLSX))
 
     try:
-        df_rules = pd.read_excel(CRP_MASTER_XLSX, sheet_name=CRP_RULES_SHEET)
+        return cached_pickle(
+            CRP_RULES_PICKLE, xlsx_mtime, RULES_CACHE_VERSION, compile_rules, refresh=refresh
+        )
     except Exception:
-        _crp_rule_map = {}
-        return _crp_rule_map
+        return {}
+
 
-    _crp_rule_map = build_crp_rule_map(df_rules)
-    return _crp_rule_map
+def get_crp_rule_map():
+    """
+    Return the CRP rule map built at startup (see on_startup), building it
+    on first use if the app was not started through the ASGI lifecycle.
+    """
+    rule_map = getattr(app.state, "crp_rule_map", None)
+    if rule_map is None:
+        rule_map = app.state.crp_rule_map = load_crp_rule_map()
+    return rule_map
+
+
+@app.post("/admin/reload_rules")
+def reload_crp_rules():
+    """
+    Re-read the CRP eligibility rules from the workbook without a restart.
+    """
+    clear_crp_cache()
+    app.state.crp_rule_map = load_crp_rule_map(refresh=True)
+    return {"status": "reloaded", "practice_codes": len(app.state.crp_rule_map)}
 
 
 # =======================================================
@@ -968,7 +1232,7 @@ def crp_counties(
 # CRP QUOTE (Excel-backed, no DB write)
 # =======================================================
 
-@app.get("/crp/quote", response_model=CrpQuoteResponse)
+@app.get("/crp/quote", responses={200: {"model": CrpQuoteResponse}})
 def crp_quote(
     state: str = Query(..., description="State abbrev or name, e.g. MI or Michigan"),
     county: str = Query(..., description="County name (case-insensitive, no 'County' needed)"),
@@ -989,14 +1253,14 @@ def crp_quote(
             ),
         )
 
-    return quote
+    return ORJSONResponse(quote.model_dump())
 
 
 # =======================================================
 # EQIP QUOTE (Excel-backed, no DB write)
 # =======================================================
 
-@app.get("/eqip/quote", response_model=EqipQuoteResponse)
+@app.get("/eqip/quote", responses={200: {"model": EqipQuoteResponse}})
 def eqip_quote(
     state: str = Query(..., description="State abbrev or name, e.g. MI or Michigan"),
     county: str = Query(..., description="County name (case-insensitive, no 'County' needed)"),
@@ -1016,14 +1280,14 @@ def eqip_quote(
             detail="No EQIP practices found for this state (and future: county).",
         )
 
-    return quote
+    return ORJSONResponse(quote.model_dump())
 
 
 # =======================================================
 # CSP QUOTE (Excel-backed, no DB write)
 # =======================================================
 
-@app.get("/csp/quote", response_model=CspQuoteResponse)
+@app.get("/csp/quote", responses={200: {"model": CspQuoteResponse}})
 def csp_quote(
     state: str = Query(..., description="State abbrev or name, e.g. MI or Michigan"),
     county: str = Query(..., description="County name (case-insensitive, kept for symmetry)"),
@@ -1042,13 +1306,13 @@ def csp_quote(
 
     # If no practices are found, just return an empty list instead of 404.
     # This keeps the API consistent with EQIP/CRP behavior.
-    return quote
+    return ORJSONResponse(quote.model_dump())
 
 # =======================================================
 # COMBINED PROGRAMS QUOTE (CRP + EQIP + CSP)
 # =======================================================
 
-@app.get("/programs/quote_all", response_model=ProgramsQuoteAllResponse)
+@app.get("/programs/quote_all", responses={200: {"model": ProgramsQuoteAllResponse}})
 def programs_quote_all(
     state: str = Query(..., description="State abbrev or name, e.g. MI or Michigan"),
     county: str = Query(..., description="County name (case-insensitive, 'County' suffix optional)"),
@@ -1070,11 +1334,13 @@ def programs_quote_all(
     eqip_quote_res = quote_eqip(state=state, county=county, acres=acres)
     csp_quote_res = quote_csp(state=state, county=county, acres=acres)
 
-    return ProgramsQuoteAllResponse(
-        state=state,
-        county=county,
-        acres=acres,
-        crp=crp_quote_res,
-        eqip=eqip_quote_res,
-        csp=csp_quote_res,
-    )
+    # The quotes are already models: dump each once instead of
+    # re-validating the composite as a response_model.
+    return ORJSONResponse({
+        "state": state,
+        "county": county,
+        "acres": acres,
+        "crp": crp_quote_res.model_dump(),
+        "eqip": eqip_quote_res.model_dump(),
+        "csp": csp_quote_res.model_dump(),
+    })
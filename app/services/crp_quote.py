@@ -1,28 +1,18 @@
 # app/services/crp_quote.py
 
-import math
-from typing import List
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..programs.models_crp import CrpPracticeRevenue, CrpQuoteResponse
-from .crp_schedule import get_crp_rows_for_state_county  # <-- reuse the schedule loader
-
-
-def _safe_float(value, default: float = 0.0) -> float:
-    """
-    Convert value to float, but:
-      - if it's NaN, inf, or invalid, return default.
-    """
-    try:
-        x = float(value)
-    except (TypeError, ValueError):
-        return default
-
-    if math.isnan(x) or math.isinf(x):
-        return default
-
-    return x
+from .crp_schedule import (  # <-- reuse the schedule loader
+    get_crp_rows_for_keys,
+    normalize_county_key,
+    normalize_state_key,
+)
+from .practice_columns import float_column, str_column
 
 
 def quote_crp(state: str, county: str, acres: float) -> CrpQuoteResponse:
@@ -32,49 +22,80 @@ def quote_crp(state: str, county: str, acres: float) -> CrpQuoteResponse:
     Uses the normalized/ cached CRP schedule from crp_schedule.get_crp_rows_for_state_county,
     so inputs like 'MI' vs 'Michigan' and 'Clare' vs 'Clare County' all work.
     """
+    return CrpQuoteResponse.model_construct(
+        state=str(state).strip().lower(),
+        county=str(county).strip().lower(),
+        acres=float(acres),
+        practices=_crp_practices(normalize_state_key(state), normalize_county_key(county), float(acres)),
+    )
 
-    df: pd.DataFrame = get_crp_rows_for_state_county(state, county)
 
-    # If no rows, return empty quote (FastAPI decides whether to 404).
-    if df is None or df.empty:
-        return CrpQuoteResponse(
-            state=str(state).strip().lower(),
-            county=str(county).strip().lower(),
-            acres=acres,
-            practices=[],
-        )
+class _CrpColumns(NamedTuple):
+    """
+    The acres-independent part of a (state, county) CRP quote.
+    """
+    codes: List[str]
+    names: List[str]
+    base_rate: np.ndarray       # float64; missing/invalid rates are 0.0
+    contract_years: np.ndarray  # float64; missing/invalid/0 lengths are 10
 
-    # Normalize the column names just in case
-    df.columns = [str(c).strip().lower() for c in df.columns]
 
-    practices: List[CrpPracticeRevenue] = []
+@lru_cache(maxsize=4096)
+def _crp_columns(state_key: str, county_key: str) -> Optional[_CrpColumns]:
+    """
+    CRP rows for normalized keys as column arrays, converted once per key
+    so quotes skip the DataFrame. Keyed on (state, county) only: the
+    entries are small and their number is bounded by the schedule.
+    """
+    df: pd.DataFrame = get_crp_rows_for_keys(state_key, county_key)
 
-    for _, row in df.iterrows():
-        base_rate = _safe_float(row.get("base_rental_rate", 0.0), default=0.0)
+    # If no rows, no practices (FastAPI decides whether to 404).
+    if df is None or df.empty:
+        return None
 
-        # Default contract length to 10 if missing/invalid
-        contract_years_raw = _safe_float(row.get("contract_length_years", 10), default=10.0)
-        contract_years = int(contract_years_raw) or 10
+    # Default contract length to 10 if missing/invalid (or truncates to 0)
+    contract_years = np.trunc(float_column(df, "contract_length_years", 10.0, allow_inf=False))
+    contract_years[contract_years == 0] = 10
 
-        annual_payment = base_rate * acres
-        total_contract_payment = annual_payment * contract_years
+    return _CrpColumns(
+        codes=str_column(df, "crp_practice_code"),
+        names=str_column(df, "crp_practice_name"),
+        base_rate=float_column(df, "base_rental_rate", 0.0, allow_inf=False),
+        contract_years=contract_years,
+    )
 
-        practices.append(
-            CrpPracticeRevenue(
-                crp_practice_code=str(row.get("crp_practice_code", "")),
-                crp_practice_name=str(row.get("crp_practice_name", "")),
-                base_rental_rate=base_rate,
-                annual_payment=annual_payment,
-                total_contract_payment=total_contract_payment,
-            )
-        )
 
-    # Sort highest annual payment first
-    practices.sort(key=lambda p: p.annual_payment, reverse=True)
+def _crp_practices(state_key: str, county_key: str, acres: float) -> List[CrpPracticeRevenue]:
+    """
+    Priced CRP practices for normalized keys, highest annual payment first.
+    """
+    cols = _crp_columns(state_key, county_key)
+    if cols is None:
+        return []
+
+    # Whole-column arithmetic instead of iterrows()
+    annual_payment = cols.base_rate * acres
+    total_contract_payment = annual_payment * cols.contract_years
+
+    # Highest annual payment first (stable, like list.sort(reverse=True))
+    order = np.argsort(-annual_payment, kind="stable")
+
+    codes = cols.codes
+    names = cols.names
+    base_rate_l = cols.base_rate.tolist()
+    annual_l = annual_payment.tolist()
+    total_l = total_contract_payment.tolist()
+
+    # Every field already has its declared type: build without re-validating
+    practices: List[CrpPracticeRevenue] = [
+        CrpPracticeRevenue.model_construct(
+            crp_practice_code=codes[i],
+            crp_practice_name=names[i],
+            base_rental_rate=base_rate_l[i],
+            annual_payment=annual_l[i],
+            total_contract_payment=total_l[i],
+        )
+        for i in order.tolist()
+    ]
 
-    return CrpQuoteResponse(
-        state=str(state).strip().lower(),
-        county=str(county).strip().lower(),
-        acres=acres,
-        practices=practices,
-    )
+    return practices
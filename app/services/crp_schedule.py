@@ -3,9 +3,12 @@
 import os
 import logging
 from functools import lru_cache
+from typing import Dict, Tuple
 
 import pandas as pd
 
+from .sheet_cache import read_sheet_cached
+
 logger = logging.getLogger(__name__)
 
 # --------------------------------------------------
@@ -84,6 +87,7 @@ _FULL_TO_ABBR = {
 }
 
 
+@lru_cache(maxsize=4096)
 def normalize_state_key(s: str) -> str:
     """
     Turn 'Alabama', 'AL', ' alAbAmA ' into a canonical key 'al'.
@@ -99,6 +103,7 @@ def normalize_state_key(s: str) -> str:
     return _FULL_TO_ABBR.get(raw, raw)
 
 
+@lru_cache(maxsize=4096)
 def normalize_county_key(s: str) -> str:
     """
     'Autauga', 'AUTAUGA ', 'autauga county' -> 'autauga'
@@ -112,6 +117,27 @@ def normalize_county_key(s: str) -> str:
     return raw
 
 
+def _clean_text(col: pd.Series) -> pd.Series:
+    # str(v).strip().lower() per cell; missing cells become "nan" like str(nan)
+    return col.astype(str).fillna("nan").str.strip().str.lower()
+
+
+def normalize_state_keys(col: pd.Series) -> pd.Series:
+    """
+    normalize_state_key over a whole column in one vectorized pass.
+    """
+    raw = _clean_text(col)
+    # Full names map to their code; 2-letter codes and unknowns pass through
+    return raw.map(_FULL_TO_ABBR).fillna(raw)
+
+
+def normalize_county_keys(col: pd.Series) -> pd.Series:
+    """
+    normalize_county_key over a whole column in one vectorized pass.
+    """
+    return _clean_text(col).str.removesuffix(" county")
+
+
 # --------------------------------------------------
 # Loader
 # --------------------------------------------------
@@ -123,7 +149,7 @@ def _load_crp_df() -> pd.DataFrame:
     add normalized state/county keys.
     """
     try:
-        df = pd.read_excel(MASTER_XLSX, sheet_name=CRP_SHEET_NAME)
+        df = read_sheet_cached(MASTER_XLSX, CRP_SHEET_NAME)
 
     except Exception as e:
         logger.warning(
@@ -133,8 +159,8 @@ def _load_crp_df() -> pd.DataFrame:
         )
         return pd.DataFrame()
 
-    # Normalize column names just in case
-    df.columns = [str(c).strip() for c in df.columns]
+    # Normalize column names so callers can use them as-is
+    df.columns = [str(c).strip().lower() for c in df.columns]
 
     # Expect at least these columns, matching your screenshot:
     # state, county, crp_practice_code, crp_practice_name,
@@ -148,16 +174,43 @@ def _load_crp_df() -> pd.DataFrame:
         )
         return pd.DataFrame()
 
-    df["state_key"] = df["state"].apply(normalize_state_key)
-    df["county_key"] = df["county"].apply(normalize_county_key)
+    df["state_key"] = normalize_state_keys(df["state"])
+    df["county_key"] = normalize_county_keys(df["county"])
+
+    # Keep only the columns the quote / county listing code reads
+    keep = {"county", "crp_practice_code", "crp_practice_name",
+            "base_rental_rate", "contract_length_years", "state_key", "county_key"}
+    df = df[[c for c in df.columns if c in keep]]
+    for col in ("base_rental_rate", "contract_length_years"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
 
     return df
 
 
+@lru_cache(maxsize=1)
+def _crp_index() -> Dict[Tuple[str, str], pd.DataFrame]:
+    """
+    (state_key, county_key) -> rows, grouped once so lookups are a dict hit
+    instead of a boolean mask over the whole sheet.
+    """
+    df = _load_crp_df()
+    if df.empty:
+        return {}
+    return dict(list(df.groupby(["state_key", "county_key"], sort=False)))
+
+
 # --------------------------------------------------
 # Public helpers
 # --------------------------------------------------
 
+def preload_crp_schedule() -> None:
+    """
+    Load and index the CRP schedule now rather than on the first quote.
+    """
+    _crp_index()
+
+
 def get_crp_rows_for_state_county(state: str, county: str) -> pd.DataFrame:
     """
     Return all CRP rows matching a given state + county, using
@@ -165,19 +218,23 @@ def get_crp_rows_for_state_county(state: str, county: str) -> pd.DataFrame:
 
       - state='alabama', 'Alabama', 'AL' all match Excel 'Alabama'
       - county='autauga', 'AUTAUGA', 'Autauga County' all match 'Autauga'
+
+    The returned frame is shared between calls; treat it as read-only.
     """
-    df = _load_crp_df()
+    return get_crp_rows_for_keys(normalize_state_key(state), normalize_county_key(county))
+
 
-    # If we couldn't load anything, or the normalized columns aren't there,
+def get_crp_rows_for_keys(state_key: str, county_key: str) -> pd.DataFrame:
+    """
+    get_crp_rows_for_state_county for keys that are already normalized
+    (normalize_state_key / normalize_county_key).
+    """
+    # If we couldn't load anything, or there is no such county,
     # just return an empty DataFrame and let the caller handle it.
-    if df.empty or "state_key" not in df.columns or "county_key" not in df.columns:
+    rows = _crp_index().get((state_key, county_key))
+    if rows is None:
         return pd.DataFrame()
-
-    state_key = normalize_state_key(state)
-    county_key = normalize_county_key(county)
-
-    mask = (df["state_key"] == state_key) & (df["county_key"] == county_key)
-    return df.loc[mask].copy()
+    return rows
 
 
 
@@ -2,83 +2,75 @@
 
 from typing import List
 
-import pandas as pd
+import numpy as np
 
-from .eqip_schedule import get_eqip_rows_for_state_county, PER_ACRE_UNITS
+from .eqip_schedule import get_eqip_columns_for_keys
+from .state_normalize import normalize_state, normalize_county
 from ..programs.models_eqip import EqipPracticeQuote, EqipQuoteResponse
 
 DEFAULT_CONTRACT_YEARS = 1  # one-year payments unless spreadsheet says otherwise
 
 
-def _safe_float(value, default: float = 0.0) -> float:
-    try:
-        x = float(value)
-    except (TypeError, ValueError):
-        return default
-    if pd.isna(x):
-        return default
-    return x
-
-
 def quote_eqip(state: str, county: str, acres: float) -> EqipQuoteResponse:
     """
     EQIP revenue engine using normalized state+county indexing.
     - If unit in PER_ACRE_UNITS → per-acre payment * acres
     - Otherwise → flat payment
     """
+    return EqipQuoteResponse.model_construct(
+        state=state.lower(),
+        county=county.lower(),
+        acres=float(acres),
+        practices=_eqip_practices(normalize_state(state), normalize_county(county), float(acres)),
+    )
 
-    rows = get_eqip_rows_for_state_county(state, county)
 
-    # No rows found → return empty (FastAPI decides when to 404)
-    if rows is None or rows.empty:
-        return EqipQuoteResponse(
-            state=state.lower(),
-            county=county.lower(),
-            acres=acres,
-            practices=[],
-        )
+def _eqip_practices(state_key: str, county_key: str, acres: float) -> List[EqipPracticeQuote]:
+    """
+    Priced EQIP practices for normalized keys, highest annual payment first.
 
-    rows = rows.copy()
-    rows.columns = [str(c).strip().lower() for c in rows.columns]
-
-    practices: List[EqipPracticeQuote] = []
-
-    for _, row in rows.iterrows():
-        unit = str(row.get("unit", "")).strip().lower()
-        unit_rate = _safe_float(row.get("unit_rate", 0.0))
-
-        if unit in PER_ACRE_UNITS:
-            payment_basis = "per_acre"
-            payment_per_acre = unit_rate
-            annual_payment = unit_rate * acres
-        else:
-            payment_basis = "flat"
-            payment_per_acre = 0.0
-            annual_payment = unit_rate
-
-        total_contract_payment = annual_payment * DEFAULT_CONTRACT_YEARS
-
-        practices.append(
-            EqipPracticeQuote(
-                practice_code=str(row.get("practice_code", "")),
-                scenario_code=str(row.get("scenario_code", "")),
-                scenario_name=str(row.get("scenario_name", "")),
-                unit=str(row.get("unit", "")),
-                payment_type=str(row.get("payment_type", "")),
-                unit_rate=unit_rate,
-                payment_basis=payment_basis,
-                payment_per_acre=payment_per_acre,
-                annual_payment=annual_payment,
-                total_contract_payment=total_contract_payment,
-                contract_years=DEFAULT_CONTRACT_YEARS,
-            )
-        )
+    Only the acres-independent PracticeColumns are cached (per key, in the
+    schedule index); pricing for `acres` is a few array ops per request.
+    """
+    cols = get_eqip_columns_for_keys(state_key, county_key)
 
-    practices.sort(key=lambda p: p.annual_payment, reverse=True)
+    # No rows found → return empty (FastAPI decides when to 404)
+    if cols is None or not cols.unit:
+        return []
+
+    # Whole-column arithmetic on the arrays prepared at load time
+    unit_rate = cols.unit_rate
+    per_acre = cols.per_acre
+
+    payment_per_acre = np.where(per_acre, unit_rate, 0.0)
+    annual_payment = np.where(per_acre, unit_rate * acres, unit_rate)
+    total_contract_payment = annual_payment * DEFAULT_CONTRACT_YEARS
+
+    # Highest annual payment first (stable, like list.sort(reverse=True))
+    order = np.argsort(-annual_payment, kind="stable")
+
+    unit_rate_l = unit_rate.tolist()
+    per_acre_l = per_acre.tolist()
+    payment_per_acre_l = payment_per_acre.tolist()
+    annual_l = annual_payment.tolist()
+    total_l = total_contract_payment.tolist()
+
+    # Every field already has its declared type: build without re-validating
+    practices: List[EqipPracticeQuote] = [
+        EqipPracticeQuote.model_construct(
+            practice_code=cols.practice_code[i],
+            scenario_code=cols.scenario_code[i],
+            scenario_name=cols.scenario_name[i],
+            unit=cols.unit[i],
+            payment_type=cols.payment_type[i],
+            unit_rate=unit_rate_l[i],
+            payment_basis="per_acre" if per_acre_l[i] else "flat",
+            payment_per_acre=payment_per_acre_l[i],
+            annual_payment=annual_l[i],
+            total_contract_payment=total_l[i],
+            contract_years=DEFAULT_CONTRACT_YEARS,
+        )
+        for i in order.tolist()
+    ]
 
-    return EqipQuoteResponse(
-        state=state.lower(),
-        county=county.lower(),
-        acres=acres,
-        practices=practices,
-    )
+    return practices
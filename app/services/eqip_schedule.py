@@ -3,11 +3,13 @@
 import os
 import logging
 from functools import lru_cache
-from typing import Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
 import pandas as pd
 
-from .state_normalize import normalize_state, normalize_county
+from .practice_columns import PracticeColumns, practice_columns
+from .sheet_cache import read_sheet_cached
+from .state_normalize import normalize_county_series, normalize_state_series
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,9 @@ PER_ACRE_UNITS: Set[str] = {
 
 _eqip_df: Optional[pd.DataFrame] = None
 
+# Rows that apply to a whole state carry this county_norm
+STATEWIDE_COUNTY = ""
+
 
 @lru_cache(maxsize=1)
 def _load_eqip_schedule() -> Optional[pd.DataFrame]:
@@ -44,7 +49,7 @@ def _load_eqip_schedule() -> Optional[pd.DataFrame]:
         return _eqip_df
 
     try:
-        df = pd.read_excel(MASTER_XLSX, sheet_name=EQIP_SHEET_NAME)
+        df = read_sheet_cached(MASTER_XLSX, EQIP_SHEET_NAME)
     except Exception as e:
         logger.warning(
             "could not load EQIP schedule from %s (sheet=%s): %s",
@@ -59,9 +64,9 @@ def _load_eqip_schedule() -> Optional[pd.DataFrame]:
     df.columns = [str(c).strip().lower() for c in df.columns]
 
     # Sanity-check required columns
+    # 'county' is optional: schedules published per state apply statewide
     required = [
         "state",
-        "county",
         "practice_code",
         "scenario_code",
         "scenario_name",
@@ -74,31 +79,58 @@ def _load_eqip_schedule() -> Optional[pd.DataFrame]:
         logger.warning("EQIP schedule is missing columns: %s", missing)
 
     # Add normalized keys
-    df["state_norm"] = df["state"].apply(normalize_state)
-    df["county_norm"] = df["county"].apply(normalize_county)
+    df["state_norm"] = normalize_state_series(df["state"])
+    if "county" in df.columns:
+        df["county_norm"] = normalize_county_series(df["county"])
+    else:
+        df["county_norm"] = STATEWIDE_COUNTY
+
+    # Keep only the columns the quote code reads, with compact dtypes:
+    # unit / payment_type take a handful of distinct values.
+    df = df[[c for c in required if c in df.columns] + ["state_norm", "county_norm"]]
+    if "unit_rate" in df.columns:
+        df["unit_rate"] = pd.to_numeric(df["unit_rate"], errors="coerce")
+    for col in ("unit", "payment_type"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
 
     _eqip_df = df
     return _eqip_df
 
 
-def get_eqip_rows_for_state_county(state: str, county: str) -> Optional[pd.DataFrame]:
+@lru_cache(maxsize=1)
+def _eqip_index() -> Dict[Tuple[str, str], PracticeColumns]:
     """
-    Return all EQIP rows for a given (state, county), using normalized keys.
-    Accepts 'MI' vs 'Michigan', 'Clare' vs 'Clare County', etc.
+    (state_norm, county_norm) -> that slice of the schedule as PracticeColumns,
+    grouped and converted once so a quote is a dict hit that never touches
+    a DataFrame.
     """
     df = _load_eqip_schedule()
-    if df is None or df.empty:
-        return None
+    if df is None or df.empty or "state_norm" not in df.columns:
+        return {}
+    return {
+        key: practice_columns(rows, PER_ACRE_UNITS)
+        for key, rows in df.groupby(["state_norm", "county_norm"], sort=False)
+    }
 
-    state_key = normalize_state(state)
-    county_key = normalize_county(county)
 
-    subset = df[
-        (df["state_norm"] == state_key) &
-        (df["county_norm"] == county_key)
-    ].copy()
+def preload_eqip_schedule() -> None:
+    """
+    Load and index the EQIP schedule now rather than on the first quote.
+    """
+    _eqip_index()
 
-    if subset.empty:
-        return None
 
-    return subset
+def get_eqip_columns_for_keys(state_key: str, county_key: str) -> Optional[PracticeColumns]:
+    """
+    EQIP rows for a (state, county) as PracticeColumns, for keys that are
+    already normalized (normalize_state / normalize_county), so 'MI' vs
+    'Michigan' and 'Clare' vs 'Clare County' share one entry.
+    Falls back to the state's statewide rows when no county-specific rows exist.
+    """
+    index = _eqip_index()
+
+    columns = index.get((state_key, county_key))
+    if columns is None:
+        columns = index.get((state_key, STATEWIDE_COUNTY))
+    return columns
@@ -1,8 +1,13 @@
 # app/services/gis_client.py
 
+import logging
+from functools import lru_cache
+
 from pydantic import BaseModel
 import httpx
 
+logger = logging.getLogger(__name__)
+
 
 class TerrainAttributes(BaseModel):
     elevation: float | None = None
@@ -11,30 +16,49 @@ class TerrainAttributes(BaseModel):
 
 GIS_API_BASE = "http://146.190.136.189:8000"  # DigitalOcean GIS API base URL
 
+# One pooled client for the process, so lookups reuse keep-alive connections
+# instead of opening a new one per call. httpx.Client is thread-safe, which
+# matters because the sync endpoints calling this run on the threadpool.
+_client = httpx.Client(
+    base_url=GIS_API_BASE,
+    timeout=8.0,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+)
+
+
+# Terrain lookups are cached per grid cell of 1/10000 degree (~11 m), finer
+# than the DEM behind the API, so repeat and nearby parcels skip the HTTP call.
+TERRAIN_GRID_STEPS = 10_000
+
 
 def fetch_terrain(lat: float, lon: float) -> TerrainAttributes:
     """
     Call the remote GIS API to get basic terrain attributes
     for this lat/lon. Synchronous on purpose so we don't
     have to change your FastAPI endpoints to async.
-    """
-    url = f"{GIS_API_BASE}/debug/terrain"
-    params = {"lat": lat, "lon": lon}
 
+    Results are cached per grid cell (see TERRAIN_GRID_STEPS);
+    failed lookups are not cached.
+    """
     try:
-        resp = httpx.get(url, params=params, timeout=8.0)
-        resp.raise_for_status()
-        data = resp.json()
-
-        # Debugging – you can keep or remove later
-        print("DEBUG Terrain JSON keys:", list(data.keys()))
-        print("DEBUG Terrain JSON sample:", {
-            k: data.get(k) for k in list(data.keys())[:6]
-        })
+        return _fetch_terrain_cell(
+            round(lat * TERRAIN_GRID_STEPS),
+            round(lon * TERRAIN_GRID_STEPS),
+        )
     except Exception as e:
-        print(f"GIS fetch failed: {e}")
+        logger.warning("GIS fetch failed: %s", e)
         return TerrainAttributes()
 
+
+@lru_cache(maxsize=65536)
+def _fetch_terrain_cell(lat_q: int, lon_q: int) -> TerrainAttributes:
+    # Raises on any failure so that only successful lookups are cached.
+    params = {"lat": lat_q / TERRAIN_GRID_STEPS, "lon": lon_q / TERRAIN_GRID_STEPS}
+
+    resp = _client.get("/debug/terrain", params=params)
+    resp.raise_for_status()
+    data = resp.json()
+
     # Elevation: now includes elevation_m
     elev = None
     for key in (
@@ -0,0 +1,83 @@
+# app/services/practice_columns.py
+
+import math
+from typing import Collection, List, NamedTuple
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+class PracticeColumns(NamedTuple):
+    """
+    One (state, county) slice of an EQIP/CSP schedule as plain column arrays,
+    converted once at load so quotes never touch a DataFrame.
+    """
+    practice_code: List[str]
+    scenario_code: List[str]
+    scenario_name: List[str]
+    unit: List[str]
+    payment_type: List[str]
+    unit_rate: np.ndarray  # float64; missing/invalid rates are 0.0
+    per_acre: np.ndarray   # bool; unit is one of the per-acre units
+
+
+def _safe_float(value, default: float = 0.0, allow_inf: bool = True) -> float:
+    try:
+        x = float(value)
+    except (TypeError, ValueError):
+        return default
+    if x != x:  # NaN; a plain float compare instead of pd.isna dispatch
+        return default
+    if not allow_inf and math.isinf(x):
+        return default
+    return x
+
+
+def float_column(
+    rows: pd.DataFrame, col: str, default: float = 0.0, allow_inf: bool = True
+) -> np.ndarray:
+    """
+    _safe_float over a whole column: missing/invalid cells (and +/-inf unless
+    `allow_inf`) become `default`. Numeric columns (the normal case for
+    spreadsheet rates) convert in one pass; anything else falls back per cell.
+    """
+    if col not in rows.columns:
+        return np.full(len(rows), default)
+    values = rows[col]
+    if is_numeric_dtype(values):
+        arr = values.to_numpy(dtype="float64", na_value=np.nan)
+        keep = ~np.isnan(arr) if allow_inf else np.isfinite(arr)
+        return np.where(keep, arr, default)
+    return np.fromiter(
+        (_safe_float(v, default, allow_inf) for v in values.tolist()),
+        dtype="float64",
+        count=len(values),
+    )
+
+
+def str_column(rows: pd.DataFrame, col: str) -> List[str]:
+    """
+    str() of every cell in a column, or "" per row if the column is missing.
+    """
+    if col not in rows.columns:
+        return [""] * len(rows)
+    return [str(v) for v in rows[col].tolist()]
+
+
+def practice_columns(rows: pd.DataFrame, per_acre_units: Collection[str]) -> PracticeColumns:
+    """
+    Convert schedule rows (lowercase column names) into PracticeColumns.
+    """
+    units = str_column(rows, "unit")
+    return PracticeColumns(
+        practice_code=str_column(rows, "practice_code"),
+        scenario_code=str_column(rows, "scenario_code"),
+        scenario_name=str_column(rows, "scenario_name"),
+        unit=units,
+        payment_type=str_column(rows, "payment_type"),
+        unit_rate=float_column(rows, "unit_rate"),
+        per_acre=np.fromiter(
+            (u.strip().lower() in per_acre_units for u in units), dtype=bool, count=len(units)
+        ),
+    )
@@ -0,0 +1,73 @@
+# app/services/sheet_cache.py
+
+import os
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import pandas as pd
+
+from ..utils.pickle_cache import cached_pickle
+
+# Version key of the schedule pickles; bump it when the parse changes.
+SHEET_CACHE_VERSION = 1
+
+# Workbook path -> its open ExcelFile (None until a sheet is first parsed)
+# while a shared_workbook() block for that path is active.
+_shared_workbooks: Dict[str, Optional[pd.ExcelFile]] = {}
+
+
+def _cached_frame_path(path: str, sheet_name: str) -> str:
+    # Distinct from the engine's data_loader pickles, which keep only a
+    # subset of columns for the same sheets.
+    return f"{path}.{sheet_name}.schedule.pkl"
+
+
+def _open_workbook(path: str) -> pd.ExcelFile:
+    return pd.ExcelFile(
+        path,
+        engine="openpyxl",
+        engine_kwargs={"read_only": True, "data_only": True},
+    )
+
+
+@contextmanager
+def shared_workbook(path: str):
+    """
+    Within this block, every read_sheet_cached(path, ...) that has to parse
+    the workbook shares one open ExcelFile, so the zip and shared strings are
+    parsed once rather than per sheet. The workbook is only opened if some
+    sheet's pickle is stale, and is closed when the block exits.
+    """
+    key = os.path.abspath(path)
+    _shared_workbooks[key] = None
+    try:
+        yield
+    finally:
+        workbook = _shared_workbooks.pop(key)
+        if workbook is not None:
+            workbook.close()
+
+
+def _parse_sheet(path: str, sheet_name: str) -> pd.DataFrame:
+    key = os.path.abspath(path)
+    if key not in _shared_workbooks:
+        with _open_workbook(path) as workbook:
+            return workbook.parse(sheet_name)
+
+    workbook = _shared_workbooks[key]
+    if workbook is None:
+        workbook = _shared_workbooks[key] = _open_workbook(path)
+    return workbook.parse(sheet_name)
+
+
+def read_sheet_cached(path: str, sheet_name: str) -> pd.DataFrame:
+    """
+    pd.read_excel for one sheet, backed by a pickle of the parsed frame next
+    to the workbook (see cached_pickle), so restarts skip the openpyxl parse.
+    """
+    return cached_pickle(
+        _cached_frame_path(path, sheet_name),
+        os.path.getmtime(path),
+        SHEET_CACHE_VERSION,
+        lambda: _parse_sheet(path, sheet_name),
+    )
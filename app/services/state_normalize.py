@@ -1,100 +1,183 @@
 # app/services/state_normalize.py
 
-from typing import Dict
+import re
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Pattern, Tuple
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-def _abbr_to_name_map() -> Dict[str, str]:
-    """
-    Internal helper: 2-letter state abbreviation -> full lowercase name.
-    """
-    return {
-        "al": "alabama",
-        "ak": "alaska",
-        "az": "arizona",
-        "ar": "arkansas",
-        "ca": "california",
-        "co": "colorado",
-        "ct": "connecticut",
-        "de": "delaware",
-        "fl": "florida",
-        "ga": "georgia",
-        "hi": "hawaii",
-        "id": "idaho",
-        "il": "illinois",
-        "in": "indiana",
-        "ia": "iowa",
-        "ks": "kansas",
-        "ky": "kentucky",
-        "la": "louisiana",
-        "me": "maine",
-        "md": "maryland",
-        "ma": "massachusetts",
-        "mi": "michigan",
-        "mn": "minnesota",
-        "ms": "mississippi",
-        "mo": "missouri",
-        "mt": "montana",
-        "ne": "nebraska",
-        "nv": "nevada",
-        "nh": "new hampshire",
-        "nj": "new jersey",
-        "nm": "new mexico",
-        "ny": "new york",
-        "nc": "north carolina",
-        "nd": "north dakota",
-        "oh": "ohio",
-        "ok": "oklahoma",
-        "or": "oregon",
-        "pa": "pennsylvania",
-        "ri": "rhode island",
-        "sc": "south carolina",
-        "sd": "south dakota",
-        "tn": "tennessee",
-        "tx": "texas",
-        "ut": "utah",
-        "vt": "vermont",
-        "va": "virginia",
-        "wa": "washington",
-        "wv": "west virginia",
-        "wi": "wisconsin",
-        "wy": "wyoming",
-    }
-
-
-def normalize_state(value: str) -> str:
+# 2-letter state abbreviation -> full lowercase name. Built once at import;
+# normalize_state runs per spreadsheet cell.
+_ABBR_TO_NAME: Dict[str, str] = {
+    "al": "alabama",
+    "ak": "alaska",
+    "az": "arizona",
+    "ar": "arkansas",
+    "ca": "california",
+    "co": "colorado",
+    "ct": "connecticut",
+    "de": "delaware",
+    "fl": "florida",
+    "ga": "georgia",
+    "hi": "hawaii",
+    "id": "idaho",
+    "il": "illinois",
+    "in": "indiana",
+    "ia": "iowa",
+    "ks": "kansas",
+    "ky": "kentucky",
+    "la": "louisiana",
+    "me": "maine",
+    "md": "maryland",
+    "ma": "massachusetts",
+    "mi": "michigan",
+    "mn": "minnesota",
+    "ms": "mississippi",
+    "mo": "missouri",
+    "mt": "montana",
+    "ne": "nebraska",
+    "nv": "nevada",
+    "nh": "new hampshire",
+    "nj": "new jersey",
+    "nm": "new mexico",
+    "ny": "new york",
+    "nc": "north carolina",
+    "nd": "north dakota",
+    "oh": "ohio",
+    "ok": "oklahoma",
+    "or": "oregon",
+    "pa": "pennsylvania",
+    "ri": "rhode island",
+    "sc": "south carolina",
+    "sd": "south dakota",
+    "tn": "tennessee",
+    "tx": "texas",
+    "ut": "utah",
+    "vt": "vermont",
+    "va": "virginia",
+    "wa": "washington",
+    "wv": "west virginia",
+    "wi": "wisconsin",
+    "wy": "wyoming",
+}
+
+# Abbreviations and full names -> canonical full name, so normalize_state is
+# one lookup whatever the input shape. Names are interned so keys built from
+# them compare by identity downstream.
+_STATE_CANON: Dict[str, str] = {
+    **{abbr: sys.intern(name) for abbr, name in _ABBR_TO_NAME.items()},
+    **{name: sys.intern(name) for name in _ABBR_TO_NAME.values()},
+}
+
+# The spellings spreadsheets actually use ('MI', 'Michigan', 'NEW YORK'),
+# so the common inputs resolve before paying for .lower().
+_STATE_CANON_CASED: Dict[str, str] = {
+    **{key.upper(): name for key, name in _STATE_CANON.items()},
+    **{key.title(): name for key, name in _STATE_CANON.items()},
+    **_STATE_CANON,
+}
+
+# County-equivalent suffixes, longest first so ' city and borough' wins over
+# ' borough' (Louisiana parishes, Alaska boroughs / census areas, ...).
+_COUNTY_SUFFIXES: Tuple[str, ...] = (
+    " city and borough",
+    " municipality",
+    " census area",
+    " borough",
+    " parish",
+    " county",
+)
+_COUNTY_SUFFIX_RE: Pattern[str] = re.compile("(?:" + "|".join(map(re.escape, _COUNTY_SUFFIXES)) + ")$")
+
+
+def normalize_state(value: Any) -> str:
     """
     Normalize any state input or spreadsheet value to full lowercase name,
     e.g. 'MI' -> 'michigan', 'Michigan' -> 'michigan'.
     """
+    # Coerce before the cache, so any value works (unhashable ones included)
+    return _normalize_state_text(value if type(value) is str else str(value))
 
-    s = str(value).strip().lower()
-    if not s:
-        return ""
 
-    abbr_to_name = _abbr_to_name_map()
+@lru_cache(maxsize=4096)
+def _normalize_state_text(value: str) -> str:
+    s = value.strip()
+    canon = _STATE_CANON_CASED.get(s)
+    if canon is not None:
+        return canon
 
-    # If it's exactly a known full name, keep it
-    if s in abbr_to_name.values():
-        return s
+    # Known abbreviation or full name in any other casing -> full name;
+    # anything else cleaned
+    s = s.lower()
+    return _STATE_CANON.get(s, s)
 
-    # If it's a 2-letter abbreviation, map to full name
-    if len(s) == 2 and s in abbr_to_name:
-        return abbr_to_name[s]
 
-    # Otherwise just return the cleaned string
-    return s
-
-
-def normalize_county(value: str) -> str:
+def normalize_county(value: Any) -> str:
     """
     Normalize county names:
       'Clare County' -> 'clare'
       ' clare '      -> 'clare'
       'CLARE'        -> 'clare'
+      'Acadia Parish' -> 'acadia'  (likewise borough, census area, ...)
+    """
+    return _normalize_county_text(value if type(value) is str else str(value))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_county_text(value: str) -> str:
+    s = value.strip().lower()
+    # One C-level check for the common no-suffix case
+    if s.endswith(_COUNTY_SUFFIXES):
+        for suffix in _COUNTY_SUFFIXES:
+            if s.endswith(suffix):
+                # Only needed here: 'x  county' exposes inner whitespace at the end
+                return sys.intern(s[:-len(suffix)].rstrip())
+    return sys.intern(s)
+
+
+# -------------------------------------------------------
+# Batch variants for whole spreadsheet columns: the same results as mapping
+# the scalar functions over each cell, using pandas string kernels instead.
+# Columns repeat a few thousand distinct values across every row, so the
+# string work runs once per distinct value and is broadcast back by code.
+# pandas/numpy are imported here rather than at module top, so scalar-only
+# callers don't pay their import time.
+# -------------------------------------------------------
+
+def _per_distinct(
+    values: "pd.Series", normalize_distinct: Callable[["pd.Series"], "pd.Series"]
+) -> "pd.Series":
+    import numpy as np
+    import pandas as pd
+
+    # Factorize the str() forms, so 3 and 3.0 stay distinct ('3' vs '3.0');
+    # missing cells become "nan" like str(nan).
+    codes, uniques = pd.factorize(values.astype(str).fillna("nan"))
+    cleaned = pd.Series(uniques, dtype=object).str.strip().str.lower()
+    normalized = np.array([sys.intern(v) for v in normalize_distinct(cleaned).tolist()], dtype=object)
+    return pd.Series(normalized[codes], index=values.index)
+
+
+def _normalize_states(cleaned: "pd.Series") -> "pd.Series":
+    return cleaned.map(_STATE_CANON).fillna(cleaned)
+
+
+def _normalize_counties(cleaned: "pd.Series") -> "pd.Series":
+    # The leftmost match is the longest suffix, as in normalize_county
+    return cleaned.str.replace(_COUNTY_SUFFIX_RE, "", regex=True).str.rstrip()
+
+
+def normalize_state_series(values: "pd.Series") -> "pd.Series":
+    """
+    normalize_state over a whole column.
+    """
+    return _per_distinct(values, _normalize_states)
+
+
+def normalize_county_series(values: "pd.Series") -> "pd.Series":
+    """
+    normalize_county over a whole column.
     """
-    s = str(value).strip().lower()
-    if not s:
-        return ""
-    if s.endswith(" county"):
-        s = s[:-7]
-    return s.strip()
+    return _per_distinct(values, _normalize_counties)
@@ -0,0 +1,49 @@
+# app/utils/pickle_cache.py
+
+import os
+import pickle
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def cached_pickle(
+    cache_path: str,
+    source_mtime: float,
+    version: Any,
+    build: Callable[[], T],
+    refresh: bool = False,
+) -> T:
+    """
+    Return build(), persisted as a pickle sidecar at `cache_path`.
+
+    The pickle stores (version, value) and is reused while it is at least as
+    new as the source (`source_mtime`) and its version equals `version`.
+    Callers put everything that shapes the value into `version` (a format
+    number, the dtypes/columns requested, ...), so a code change that alters
+    the result rebuilds instead of loading a stale pickle. `refresh` skips
+    the pickle and always rebuilds (and rewrites) it.
+
+    An unreadable pickle is rebuilt; a failed write (read-only data dir)
+    just keeps the freshly built value in memory.
+    """
+    if (
+        not refresh
+        and os.path.exists(cache_path)
+        and os.path.getmtime(cache_path) >= source_mtime
+    ):
+        try:
+            with open(cache_path, "rb") as f:
+                cached_version, value = pickle.load(f)
+            if cached_version == version:
+                return value
+        except Exception:
+            pass  # unreadable/stale format: rebuild below
+
+    value = build()
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((version, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return value